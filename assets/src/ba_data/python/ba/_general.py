@@ -21,11 +21,13 @@
 """Utility snippets applying to generic Python code."""
 from __future__ import annotations
 
+import functools
 import types
 import weakref
 from typing import TYPE_CHECKING, TypeVar
 
 import _ba
+from ba import _error
 
 if TYPE_CHECKING:
     from typing import Any, Type
@@ -42,15 +44,19 @@ def getclass(name: str, subclassof: Type[T]) -> Type[T]:
     The class will be checked to make sure it is a subclass of the provided
     'subclassof' class, and a TypeError will be raised if not.
     """
+    cls = _getclass(name)
+    if not issubclass(cls, subclassof):
+        raise TypeError(name + ' is not a subclass of ' + str(subclassof))
+    return cls
+
+
+# Successful lookups are remembered; failures raise and so aren't cached.
+@functools.lru_cache(maxsize=None)
+def _getclass(name: str) -> Type:
     import importlib
-    splits = name.split('.')
-    modulename = '.'.join(splits[:-1])
-    classname = splits[-1]
+    modulename, _, classname = name.rpartition('.')
     module = importlib.import_module(modulename)
     cls: Type = getattr(module, classname)
-
-    if not issubclass(cls, subclassof):
-        raise TypeError(name + ' is not a subclass of ' + str(subclassof))
     return cls
 
 
@@ -63,24 +69,21 @@ def json_prep(data: Any) -> Any:
     """
 
     if isinstance(data, dict):
-        return dict((json_prep(key), json_prep(value))
-                    for key, value in list(data.items()))
+        return dict(
+            (json_prep(key), json_prep(value)) for key, value in data.items())
     if isinstance(data, list):
         return [json_prep(element) for element in data]
     if isinstance(data, tuple):
-        from ba import _error
         _error.print_error('json_prep encountered tuple', once=True)
         return [json_prep(element) for element in data]
     if isinstance(data, bytes):
         try:
             return data.decode(errors='ignore')
         except Exception:
-            from ba import _error
             _error.print_error('json_prep encountered utf-8 decode error',
                                once=True)
             return data.decode(errors='ignore')
     if not isinstance(data, (str, float, bool, type(None), int)):
-        from ba import _error
         _error.print_error('got unsupported type in json_prep:' +
                            str(type(data)),
                            once=True)
@@ -90,8 +93,8 @@ def json_prep(data: Any) -> Any:
 def utf8_all(data: Any) -> Any:
     """Convert any unicode data in provided sequence(s)to utf8 bytes."""
     if isinstance(data, dict):
-        return dict((utf8_all(key), utf8_all(value))
-                    for key, value in list(data.items()))
+        return dict(
+            (utf8_all(key), utf8_all(value)) for key, value in data.items())
     if isinstance(data, list):
         return [utf8_all(element) for element in data]
     if isinstance(data, tuple):
@@ -153,6 +156,8 @@ class _WeakCall:
     to wrap them in weakrefs manually if desired.
     """
 
+    __slots__ = ('_call', '_args', '_keywds')
+
     def __init__(self, *args: Any, **keywds: Any) -> None:
         """
         Instantiate a WeakCall; pass a callable as the first
@@ -184,7 +189,15 @@ class _WeakCall:
         self._keywds = keywds
 
     def __call__(self, *args_extra: Any) -> Any:
-        return self._call(*self._args + args_extra, **self._keywds)
+        # Avoid building new arg tuples/dicts in the common case of
+        # no extra args and/or no keywords (timers fire lots of these).
+        if args_extra:
+            if self._keywds:
+                return self._call(*self._args, *args_extra, **self._keywds)
+            return self._call(*self._args, *args_extra)
+        if self._keywds:
+            return self._call(*self._args, **self._keywds)
+        return self._call(*self._args)
 
     def __str__(self) -> str:
         return ('<ba.WeakCall object; _call=' + str(self._call) + ' _args=' +
@@ -205,6 +218,8 @@ class _Call:
     without keeping its object alive.
     """
 
+    __slots__ = ('_call', '_args', '_keywds')
+
     def __init__(self, *args: Any, **keywds: Any):
         """
         Instantiate a Call; pass a callable as the first
@@ -222,7 +237,13 @@ class _Call:
         self._keywds = keywds
 
     def __call__(self, *args_extra: Any) -> Any:
-        return self._call(*self._args + args_extra, **self._keywds)
+        if args_extra:
+            if self._keywds:
+                return self._call(*self._args, *args_extra, **self._keywds)
+            return self._call(*self._args, *args_extra)
+        if self._keywds:
+            return self._call(*self._args, **self._keywds)
+        return self._call(*self._args)
 
     def __str__(self) -> str:
         return ('<ba.Call object; _call=' + str(self._call) + ' _args=' +
@@ -246,6 +267,11 @@ class WeakMethod:
     free to die. If called with a dead target, is simply a no-op.
     """
 
+    # Note: we intentionally don't wrap the stdlib weakref.WeakMethod here;
+    # its __call__ is pure Python and builds a new bound method each time,
+    # making it roughly twice as slow to call as this (and slower to create).
+    __slots__ = ('_func', '_obj')
+
     def __init__(self, call: types.MethodType):
         assert isinstance(call, types.MethodType)
         self._func = call.__func__
@@ -255,7 +281,7 @@ class WeakMethod:
         obj = self._obj()
         if obj is None:
             return None
-        return self._func(*((obj, ) + args), **keywds)
+        return self._func(obj, *args, **keywds)
 
     def __str__(self) -> str:
         return '<ba.WeakMethod object; call=' + str(self._func) + '>'
@@ -22,20 +22,25 @@
 
 from __future__ import annotations
 
+import functools
 import random
 import weakref
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
 
 import _ba
+from ba import _error
+from ba._general import Call
+from ba._lang import Lstr
 
 if TYPE_CHECKING:
     import ba
     from weakref import ReferenceType
-    from typing import Any, Dict, Optional, Sequence, Union, Tuple
+    from typing import Any, Dict, Optional, Sequence, Union, Tuple, Type
+    from bastd.actor.popuptext import PopupText
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlayerScoredMessage:
     # noinspection PyUnresolvedReferences
     """Informs something that a ba.Player scored.
@@ -47,8 +52,84 @@ class PlayerScoredMessage:
         score
             The score value.
     """
+    __slots__ = ('score', )
     score: int
 
+    # Frozen dataclasses with slots can't be copied or pickled through the
+    # default slot-state path (it uses setattr), so provide our own.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'score': self.score}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        object.__setattr__(self, 'score', state['score'])
+
+
+# Score messages are immutable, so we share instances for common values
+# instead of allocating a new one for every score event.
+_PLAYER_SCORED_MESSAGES = {
+    score: PlayerScoredMessage(score)
+    for score in range(-32, 201)
+}
+
+
+def _player_scored_message(score: int) -> PlayerScoredMessage:
+    msg = _PLAYER_SCORED_MESSAGES.get(score)
+    return PlayerScoredMessage(score) if msg is None else msg
+
+
+@dataclass(frozen=True)
+class _KillTier:
+    """Reward given for a particular multi-kill count."""
+    score: int
+    name: Optional[Lstr]  # None means build one with the kill count.
+    color: Tuple[float, float, float, float]
+    scale: float
+    delay: float
+    sound_index: int  # Index into ba.Stats.orchestrahitsounds.
+
+
+# Multi-kill rewards for 2, 3, 4, 5, and 6+ kills in a row.
+_MULTIKILL_TIERS = (
+    _KillTier(20, Lstr(resource='twoKillText'), (0.1, 1.0, 0.0, 1), 1.0, 0.0,
+              0),
+    _KillTier(40, Lstr(resource='threeKillText'), (1.0, 0.7, 0.0, 1), 1.1, 0.3,
+              1),
+    _KillTier(60, Lstr(resource='fourKillText'), (1.0, 1.0, 0.0, 1), 1.2, 0.6,
+              2),
+    _KillTier(80, Lstr(resource='fiveKillText'), (1.0, 0.5, 0.0, 1), 1.3, 0.9,
+              3),
+    _KillTier(100, None, (1.0, 0.5, 0.0, 1), 1.3, 1.0, 3),
+)
+
+
+def _multikill_text(name: Lstr, score: int, showpoints: bool) -> Lstr:
+    return Lstr(value=(('+' + str(score) + ' ') if showpoints else '') +
+                '${N}',
+                subs=[('${N}', name)])
+
+
+# Popup texts for tiers with fixed names, keyed by (tier-index, showpoints).
+def _build_multikill_texts() -> Dict[Tuple[int, bool], Lstr]:
+    texts: Dict[Tuple[int, bool], Lstr] = {}
+    for i, tier in enumerate(_MULTIKILL_TIERS):
+        if tier.name is None:
+            continue
+        for showpoints in (True, False):
+            texts[i, showpoints] = _multikill_text(tier.name, tier.score,
+                                                   showpoints)
+    return texts
+
+
+_MULTIKILL_TEXTS = _build_multikill_texts()
+
+
+# Looked up on first use; bastd imports ba so we can't grab it at load time.
+@functools.lru_cache(maxsize=None)
+def _get_popuptext_class() -> Type[PopupText]:
+    # pylint: disable=cyclic-import
+    from bastd.actor import popuptext
+    return popuptext.PopupText
+
 
 class PlayerRecord:
     """Stats for an individual player in a ba.Stats object.
@@ -59,7 +140,16 @@ class PlayerRecord:
     still present (stats may be retained for players that leave
     mid-game)
     """
+    __slots__ = ('name', 'name_full', 'score', 'accumscore', 'kill_count',
+                 'accum_kill_count', 'killed_count', 'accum_killed_count',
+                 '_multi_kill_timer', '_multi_kill_count', '_stats',
+                 '_last_player', '_player', '_team', 'streak', 'character',
+                 '__weakref__')
+
+    # These are always set via associate_with_player() in our constructor.
     character: str
+    _last_player: ba.Player
+    _team: ReferenceType[ba.Team]
 
     def __init__(self, name: str, name_full: str, player: ba.Player,
                  stats: ba.Stats):
@@ -74,9 +164,7 @@ class PlayerRecord:
         self._multi_kill_timer: Optional[ba.Timer] = None
         self._multi_kill_count = 0
         self._stats = weakref.ref(stats)
-        self._last_player: Optional[ba.Player] = None
         self._player: Optional[ba.Player] = None
-        self._team: Optional[ReferenceType[ba.Team]] = None
         self.streak = 0
         self.associate_with_player(player)
 
@@ -87,11 +175,9 @@ class PlayerRecord:
         This can still return a valid result even if the player is gone.
         Raises a ba.TeamNotFoundError if the team no longer exists.
         """
-        assert self._team is not None
         team = self._team()
         if team is None:
-            from ba._error import TeamNotFoundError
-            raise TeamNotFoundError()
+            raise _error.TeamNotFoundError()
         return team
 
     @property
@@ -100,8 +186,7 @@ class PlayerRecord:
 
         Raises a ba.PlayerNotFoundError if the player no longer exists."""
         if not self._player:
-            from ba._error import PlayerNotFoundError
-            raise PlayerNotFoundError()
+            raise _error.PlayerNotFoundError()
         return self._player
 
     def get_name(self, full: bool = False) -> str:
@@ -110,9 +195,7 @@ class PlayerRecord:
 
     def get_icon(self) -> Dict[str, Any]:
         """Get the icon for this instance's player."""
-        player = self._last_player
-        assert player is not None
-        return player.get_icon()
+        return self._last_player.get_icon()
 
     def cancel_multi_kill_timer(self) -> None:
         """Cancel any multi-kill timer for this player entry."""
@@ -129,6 +212,11 @@ class PlayerRecord:
 
     def associate_with_player(self, player: ba.Player) -> None:
         """Associate this entry with a ba.Player."""
+
+        # Grab the team now rather than deriving it from the player later;
+        # ba.Players stop working once they leave but our team property
+        # needs to keep working. (CPython hands out one shared ref per
+        # object for plain weakref.ref() calls, so this is cheap.)
         self._team = weakref.ref(player.team)
         self.character = player.character
         self._last_player = player
@@ -141,87 +229,35 @@ class PlayerRecord:
 
     def get_last_player(self) -> ba.Player:
         """Return the last ba.Player we were associated with."""
-        assert self._last_player is not None
         return self._last_player
 
     def submit_kill(self, showpoints: bool = True) -> None:
         """Submit a kill for this player entry."""
-        # FIXME Clean this up.
-        # pylint: disable=too-many-statements
-        from ba._lang import Lstr
-        from ba._general import Call
-        self._multi_kill_count += 1
         stats = self._stats()
-        assert stats
-        if self._multi_kill_count == 1:
-            score = 0
-            name = None
-            delay = 0.0
-            color = (0.0, 0.0, 0.0, 1.0)
-            scale = 1.0
-            sound = None
-        elif self._multi_kill_count == 2:
-            score = 20
-            name = Lstr(resource='twoKillText')
-            color = (0.1, 1.0, 0.0, 1)
-            scale = 1.0
-            delay = 0.0
-            sound = stats.orchestrahitsound1
-        elif self._multi_kill_count == 3:
-            score = 40
-            name = Lstr(resource='threeKillText')
-            color = (1.0, 0.7, 0.0, 1)
-            scale = 1.1
-            delay = 0.3
-            sound = stats.orchestrahitsound2
-        elif self._multi_kill_count == 4:
-            score = 60
-            name = Lstr(resource='fourKillText')
-            color = (1.0, 1.0, 0.0, 1)
-            scale = 1.2
-            delay = 0.6
-            sound = stats.orchestrahitsound3
-        elif self._multi_kill_count == 5:
-            score = 80
-            name = Lstr(resource='fiveKillText')
-            color = (1.0, 0.5, 0.0, 1)
-            scale = 1.3
-            delay = 0.9
-            sound = stats.orchestrahitsound4
-        else:
-            score = 100
-            name = Lstr(resource='multiKillText',
-                        subs=[('${COUNT}', str(self._multi_kill_count))])
-            color = (1.0, 0.5, 0.0, 1)
-            scale = 1.3
-            delay = 1.0
-            sound = stats.orchestrahitsound4
-
-        def _apply(name2: Lstr, score2: int, showpoints2: bool,
-                   color2: Tuple[float, float, float, float], scale2: float,
-                   sound2: Optional[ba.Sound]) -> None:
-            from bastd.actor.popuptext import PopupText
+        if stats is None:
+            return
+        self._multi_kill_count += 1
 
+        def _apply(text2: Lstr, score2: int, color2: Sequence[float],
+                   scale2: float, sound2: Optional[ba.Sound]) -> None:
             # Only award this if they're still alive and we can get
             # their pos.
-            if self._player is not None and self._player.node:
-                our_pos = self._player.node.position
-            else:
+            node = self._player.node if self._player is not None else None
+            if not node:
                 return
+            our_pos = node.position
 
             # Jitter position a bit since these often come in clusters.
-            our_pos = (our_pos[0] + (random.random() - 0.5) * 2.0,
-                       our_pos[1] + (random.random() - 0.5) * 2.0,
-                       our_pos[2] + (random.random() - 0.5) * 2.0)
+            rnd = random.random
+            our_pos = (our_pos[0] + rnd() * 2.0 - 1.0,
+                       our_pos[1] + rnd() * 2.0 - 1.0,
+                       our_pos[2] + rnd() * 2.0 - 1.0)
             activity = self.getactivity()
             if activity is not None:
-                PopupText(Lstr(
-                    value=(('+' + str(score2) + ' ') if showpoints2 else '') +
-                    '${N}',
-                    subs=[('${N}', name2)]),
-                          color=color2,
-                          scale=scale2,
-                          position=our_pos).autoretain()
+                _get_popuptext_class()(text2,
+                                       color=color2,
+                                       scale=scale2,
+                                       position=our_pos).autoretain()
             if sound2:
                 _ba.playsound(sound2)
 
@@ -230,12 +266,24 @@ class PlayerRecord:
 
             # Inform a running game of the score.
             if score2 != 0 and activity is not None:
-                activity.handlemessage(PlayerScoredMessage(score=score2))
-
-        if name is not None:
+                activity.handlemessage(_player_scored_message(score2))
+
+        # A single kill earns nothing extra; beyond that, look up the tier.
+        if self._multi_kill_count > 1:
+            tier_index = min(self._multi_kill_count - 2,
+                             len(_MULTIKILL_TIERS) - 1)
+            tier = _MULTIKILL_TIERS[tier_index]
+            text = _MULTIKILL_TEXTS.get((tier_index, showpoints))
+            if text is None:
+                text = _multikill_text(
+                    Lstr(resource='multiKillText',
+                         subs=[('${COUNT}', str(self._multi_kill_count))]),
+                    tier.score, showpoints)
+            sounds = stats.orchestrahitsounds
             _ba.timer(
-                0.3 + delay,
-                Call(_apply, name, score, showpoints, color, scale, sound))
+                0.3 + tier.delay,
+                Call(_apply, text, tier.score, tier.color, tier.scale,
+                     sounds[tier.sound_index] if sounds else None))
 
         # Keep the tally rollin'...
         # set a timer for a bit in the future.
@@ -247,14 +295,17 @@ class Stats:
 
     category: Gameplay Classes
     """
+    __slots__ = ('_activity', '_player_records', 'orchestrahitsounds',
+                 '__weakref__')
 
     def __init__(self) -> None:
         self._activity: Optional[ReferenceType[ba.Activity]] = None
+
+        # Note: records are keyed by player name rather than by ba.Player;
+        # a player leaving and rejoining should get their old record back,
+        # and ba.Players are just weak handles to the underlying player.
         self._player_records: Dict[str, PlayerRecord] = {}
-        self.orchestrahitsound1: Optional[ba.Sound] = None
-        self.orchestrahitsound2: Optional[ba.Sound] = None
-        self.orchestrahitsound3: Optional[ba.Sound] = None
-        self.orchestrahitsound4: Optional[ba.Sound] = None
+        self.orchestrahitsounds: Tuple[ba.Sound, ...] = ()
 
     def set_activity(self, activity: Optional[ba.Activity]) -> None:
         """Set the current activity for this instance."""
@@ -264,7 +315,6 @@ class Stats:
         # Load our media into this activity's context.
         if activity is not None:
             if activity.is_expired():
-                from ba import _error
                 _error.print_error('unexpected finalized activity')
             else:
                 with _ba.Context(activity):
@@ -280,23 +330,23 @@ class Stats:
         return self._activity()
 
     def _load_activity_media(self) -> None:
-        self.orchestrahitsound1 = _ba.getsound('orchestraHit')
-        self.orchestrahitsound2 = _ba.getsound('orchestraHit2')
-        self.orchestrahitsound3 = _ba.getsound('orchestraHit3')
-        self.orchestrahitsound4 = _ba.getsound('orchestraHit4')
+        self.orchestrahitsounds = (_ba.getsound('orchestraHit'),
+                                   _ba.getsound('orchestraHit2'),
+                                   _ba.getsound('orchestraHit3'),
+                                   _ba.getsound('orchestraHit4'))
 
     def reset(self) -> None:
         """Reset the stats instance completely."""
 
         # Just to be safe, lets make sure no multi-kill timers are gonna go off
         # for no-longer-on-the-list players.
-        for p_entry in list(self._player_records.values()):
+        for p_entry in self._player_records.values():
             p_entry.cancel_multi_kill_timer()
         self._player_records = {}
 
     def reset_accum(self) -> None:
         """Reset per-sound sub-scores."""
-        for s_player in list(self._player_records.values()):
+        for s_player in self._player_records.values():
             s_player.cancel_multi_kill_timer()
             s_player.accumscore = 0
             s_player.accum_kill_count = 0
@@ -353,14 +403,9 @@ class Stats:
         Return value is actual score with multipliers and such factored in.
         """
         # FIXME: Tidy this up.
-        # pylint: disable=cyclic-import
         # pylint: disable=too-many-branches
         # pylint: disable=too-many-locals
         # pylint: disable=too-many-statements
-        from bastd.actor.popuptext import PopupText
-        from ba import _math
-        from ba._gameactivity import GameActivity
-        from ba._lang import Lstr
         del victim_player  # Currently unused.
         name = player.get_name()
         s_player = self._player_records[name]
@@ -368,19 +413,14 @@ class Stats:
         if kill:
             s_player.submit_kill(showpoints=showpoints)
 
-        display_color: Sequence[float] = (1.0, 1.0, 1.0, 1.0)
-
-        if color is not None:
-            display_color = color
-        elif importance != 1:
-            display_color = (1.0, 1.0, 0.4, 1.0)
         points = base_points
 
         # If they want a big announcement, throw a zoom-text up there.
         if display and big_message:
+            from ba import _math
+            from ba._gameactivity import GameActivity
             try:
-                assert self._activity is not None
-                activity = self._activity()
+                activity = self.getactivity()
                 if isinstance(activity, GameActivity):
                     name_full = player.get_name(full=True, icon=False)
                     activity.show_zoom_message(
@@ -388,12 +428,12 @@ class Stats:
                              subs=[('${NAME}', name_full)]),
                         color=_math.normalized_color(player.team.color))
             except Exception:
-                from ba import _error
                 _error.print_exception('error showing big_message')
 
         # If we currently have a actor, pop up a score over it.
         if display and showpoints:
-            our_pos = player.node.position if player.node else None
+            node = player.node
+            our_pos = node.position if node else None
             if our_pos is not None:
                 if target is None:
                     target = our_pos
@@ -404,6 +444,13 @@ class Stats:
                                min(target[2], our_pos[2] + 2.0))
                 activity = self.getactivity()
                 if activity is not None:
+                    display_color: Sequence[float]
+                    if color is not None:
+                        display_color = color
+                    elif importance != 1:
+                        display_color = (1.0, 1.0, 0.4, 1.0)
+                    else:
+                        display_color = (1.0, 1.0, 1.0, 1.0)
                     if title is not None:
                         sval = Lstr(value='+${A} ${B}',
                                     subs=[('${A}', str(points)),
@@ -411,10 +458,10 @@ class Stats:
                     else:
                         sval = Lstr(value='+${A}',
                                     subs=[('${A}', str(points))])
-                    PopupText(sval,
-                              color=display_color,
-                              scale=1.2 * scale,
-                              position=display_pos).autoretain()
+                    _get_popuptext_class()(sval,
+                                           color=display_color,
+                                           scale=1.2 * scale,
+                                           position=display_pos).autoretain()
 
         # Tally kills.
         if kill:
@@ -430,7 +477,6 @@ class Stats:
                                   color=player.color,
                                   image=player.get_icon())
         except Exception:
-            from ba import _error
             _error.print_exception('error announcing score')
 
         s_player.score += points
@@ -438,9 +484,9 @@ class Stats:
 
         # Inform a running game of the score.
         if points != 0:
-            activity = self._activity() if self._activity is not None else None
+            activity = self.getactivity()
             if activity is not None:
-                activity.handlemessage(PlayerScoredMessage(score=points))
+                activity.handlemessage(_player_scored_message(points))
 
         return points
 
@@ -449,7 +495,6 @@ class Stats:
                           killed: bool = False,
                           killer: ba.Player = None) -> None:
         """Should be called when a player is killed."""
-        from ba._lang import Lstr
         name = player.get_name()
         prec = self._player_records[name]
         prec.streak = 0
@@ -488,5 +533,4 @@ class Stats:
                                       color=player.color,
                                       image=player.get_icon())
         except Exception:
-            from ba import _error
             _error.print_exception('error announcing kill')
@@ -0,0 +1,128 @@
+# Copyright (c) 2011-2020 Eric Froemling
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# -----------------------------------------------------------------------------
+"""Testing general utility functionality."""
+
+from __future__ import annotations
+
+from collections import OrderedDict, namedtuple
+from typing import TYPE_CHECKING
+
+import pytest
+
+# noinspection PyProtectedMember
+from ba._general import getclass, _getclass, json_prep, utf8_all
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def test_json_prep() -> None:
+    """Testing json_prep conversions."""
+
+    # Nested tuples become lists and bytes become strings.
+    data: Any = {'a': (1, (2, b'foo')), 'b': [b'bar', {'c': (3, )}]}
+    assert json_prep(data) == {'a': [1, [2, 'foo']], 'b': ['bar', {'c': [3]}]}
+
+    # Dict keys get converted too.
+    assert json_prep({b'key': 1}) == {'key': 1}
+
+    # Undecodable bytes are dropped rather than raising.
+    assert json_prep(b'ab\xffc') == 'abc'
+
+    # Subclasses come back as their plain json-friendly base types.
+    pair = namedtuple('pair', 'x y')
+    out = json_prep(OrderedDict(a=pair(1, 2)))
+    assert out == {'a': [1, 2]}
+    assert type(out) is dict  # pylint: disable=unidiomatic-typecheck
+    assert type(out['a']) is list  # pylint: disable=unidiomatic-typecheck
+
+
+def test_json_prep_clean_input() -> None:
+    """Clean data should come back equal but as a fresh copy."""
+    items: Any = [1, 2, {'x': 'y'}]
+    data: Any = {'name': 'foo', 'score': 12, 'ok': True, 'items': items}
+    out = json_prep(data)
+    assert out == data
+    assert out is not data
+    assert out['items'] is not data['items']
+    assert out['items'][2] is not data['items'][2]
+
+
+def test_utf8_all() -> None:
+    """Testing utf8_all conversions."""
+
+    # Strings anywhere (including dict keys) become utf-8 bytes;
+    # tuples stay tuples and everything else passes through.
+    data: Any = {'a': ('b', ['c', 1]), ('d', 'e'): None}
+    assert utf8_all(data) == {b'a': (b'b', [b'c', 1]), (b'd', b'e'): None}
+    assert utf8_all('é') == b'\xc3\xa9'
+
+    # Subclasses come back as their plain base types.
+    pair = namedtuple('pair', 'x y')
+    out = utf8_all(OrderedDict(a=pair('x', 2)))
+    assert out == {b'a': (b'x', 2)}
+    assert type(out) is dict  # pylint: disable=unidiomatic-typecheck
+    assert type(out[b'a']) is tuple  # pylint: disable=unidiomatic-typecheck
+
+    # Clean data comes back as a fresh copy.
+    data = [1, [2.0, None]]
+    out = utf8_all(data)
+    assert out == data
+    assert out is not data and out[1] is not data[1]
+
+
+def test_deep_nesting() -> None:
+    """Make sure reasonably deep structures make it through intact."""
+    depth = 100
+    data: Any = 'leaf'
+    expected_json: Any = 'leaf'
+    expected_utf8: Any = b'leaf'
+    for i in range(depth):
+        if i % 2:
+            data = {'k': (data, )}
+            expected_json = {'k': [expected_json]}
+            expected_utf8 = {b'k': (expected_utf8, )}
+        else:
+            data = [data]
+            expected_json = [expected_json]
+            expected_utf8 = [expected_utf8]
+    assert json_prep(data) == expected_json
+    assert utf8_all(data) == expected_utf8
+
+
+def test_getclass() -> None:
+    """Lookups should be cached, but failures should not."""
+    _getclass.cache_clear()
+    assert getclass('collections.OrderedDict', dict) is OrderedDict
+    assert getclass('collections.OrderedDict', dict) is OrderedDict
+    info = _getclass.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    # A subclass mismatch raises but leaves the cached class usable.
+    with pytest.raises(TypeError):
+        getclass('collections.OrderedDict', list)
+    assert getclass('collections.OrderedDict', dict) is OrderedDict
+
+    # Failed imports are retried each time rather than remembered.
+    for _i in range(2):
+        with pytest.raises(ImportError):
+            getclass('ba_no_such_module.Foo', object)
+    assert _getclass.cache_info().currsize == 1
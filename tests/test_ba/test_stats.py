@@ -0,0 +1,48 @@
+# Copyright (c) 2011-2020 Eric Froemling
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# -----------------------------------------------------------------------------
+"""Testing stats functionality."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+# noinspection PyProtectedMember
+from ba._stats import PlayerScoredMessage, _player_scored_message
+
+
+def test_player_scored_message() -> None:
+    """Shared score messages must still copy, pickle, and stay frozen."""
+    msg = _player_scored_message(10)
+    assert msg is _player_scored_message(10)
+    assert _player_scored_message(1000) == PlayerScoredMessage(1000)
+
+    for other in (copy.copy(msg), copy.deepcopy(msg),
+                  pickle.loads(pickle.dumps(msg))):
+        assert other == msg
+        assert other.score == 10
+
+    with pytest.raises(FrozenInstanceError):
+        msg.score = 5  # type: ignore
+    assert msg.score == 10